@@ -1,8 +1,93 @@
 import argparse
+import io
+import multiprocessing
+import os
 import sys
 from pathlib import Path
 from datetime import datetime
-import re
+from typing import Optional
+
+# Heavy dependencies are imported once at module load. A missing package leaves its
+# name as None so the text path can still run and the QR path can report it clearly.
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+try:
+    import numpy as np
+    import cv2
+except ImportError:
+    np = None
+    cv2 = None
+
+# WeChat's CNN-based QR detector (opencv-contrib-python) replaces OpenCV's stock
+# QRCodeDetector when all of its model files are present in this directory
+_WECHAT_MODEL_DIR = Path(__file__).resolve().parent / "wechat_qrcode"
+_WECHAT_MODEL_FILES = (
+    "detect.prototxt",
+    "detect.caffemodel",
+    "sr.prototxt",
+    "sr.caffemodel",
+)
+
+
+def _make_detector():
+    """
+    Build the QR detector: WeChatQRCode if opencv-contrib and its models are
+    available, otherwise cv2.QRCodeDetector. Returns None without OpenCV.
+    """
+    if cv2 is None:
+        return None
+    model_paths = [_WECHAT_MODEL_DIR / name for name in _WECHAT_MODEL_FILES]
+    if hasattr(cv2, "wechat_qrcode_WeChatQRCode") and all(
+        p.is_file() for p in model_paths
+    ):
+        try:
+            return cv2.wechat_qrcode_WeChatQRCode(*(str(p) for p in model_paths))
+        except cv2.error:
+            pass
+    return cv2.QRCodeDetector()
+
+
+# Shared QR detector, built once per process (workers get their own copy, since
+# OpenCV detectors cannot be pickled)
+_DETECTOR = _make_detector()
+
+# Number of rendered pages between trims of PyMuPDF's object store
+_STORE_SHRINK_EVERY = 8
+
+# Rendered pages larger than a tile on a side are scanned in tiles cut along blank
+# lines. A tile is about _TILE_SIZE_PT PDF points scaled by the zoom, roughly one code,
+# where OpenCV's detector is both fastest and most reliable, but never below
+# _TILE_MIN_PX pixels, under which the detector starts missing small codes
+_TILE_SIZE_PT = 24
+_TILE_MIN_PX = 128
+
+# Gray level below which a pixel counts as part of a QR module when laying out and
+# classifying tiles
+_INK_LEVEL = 128
+
+# Smallest ink block that can hold a QR code: 21 modules of at least one pixel
+_MIN_CODE_PX = 21
+
+# A tile's ink looks like a QR code when this share of its bounding box is dark: QR
+# modules are close to half dark, text and scanner specks far less
+_CODE_INK_SHARE = (0.25, 0.75)
+
+# Pages with no pixel darker than this carry no ink at all and are treated as blank;
+# the small tolerance below white absorbs rendering noise
+_BLANK_PAGE_MIN = 250
+
+# Deletion table for every character str.isspace() accepts (the same set as regex \s),
+# including CJK full-width space; str.translate strips them in a single C-level pass
+_WS_DELETE = str.maketrans(
+    "",
+    "",
+    "\t\n\v\f\r\x1c\x1d\x1e\x1f \x85\xa0\u1680"
+    "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    "\u2028\u2029\u202f\u205f\u3000",
+)
 
 
 def extract_text_from_pdf(pdf_path: Path) -> str:
@@ -10,164 +95,420 @@ def extract_text_from_pdf(pdf_path: Path) -> str:
     Try to extract text directly from the PDF using PyMuPDF.
     Returns a string with original line breaks preserved if text exists; otherwise empty string.
     """
-    try:
-        import fitz  # PyMuPDF
-    except Exception as e:
+    if fitz is None:
         # PyMuPDF not available
         return ""
 
-    text_pages: list[str] = []
+    # Paragraphs are delimited by '+'; build each one from per-block pieces so the
+    # whole document is never materialised as one string
+    paragraphs: list[str] = []
+    current: list[str] = []
+    has_text = False
+
+    def flush() -> None:
+        paragraph = "".join(current).strip()
+        if paragraph:
+            paragraphs.append(paragraph)
+        current.clear()
+
     try:
+        # Pages are read sequentially from one document: PyMuPDF is not thread-safe
+        # and get_text holds the GIL, so threads would add risk without any speed-up
         with fitz.open(pdf_path) as doc:
             for page in doc:
-                # 'text' format keeps line breaks reasonably well
-                page_text = page.get_text("text")
-                # Normalize whitespace but keep '+', since '+' is the paragraph delimiter
-                page_text = page_text.replace("\r\n", "\n").replace("\r", "\n")
-                page_text = re.sub(r"\s+", "", page_text).strip()
-                if page_text:
-                    text_pages.append(page_text)
+                # Blocks come back in the same reading order as the 'text' format;
+                # whitespace is dropped but '+' kept, since it is the paragraph delimiter
+                page_text = "".join(
+                    block[4].translate(_WS_DELETE)
+                    for block in page.get_text("blocks")
+                    if block[6] == 0  # text blocks only
+                )
+                if not page_text:
+                    continue
+                # Pages are separated by a space within a paragraph
+                if has_text:
+                    current.append(" ")
+                has_text = True
+                *done, rest = page_text.split("+")
+                for piece in done:
+                    current.append(piece)
+                    flush()
+                current.append(rest)
     except Exception:
         return ""
 
-    # Concatenate all pages with a space; then split paragraphs by '+' and remove it from output
-    all_text = " ".join(text_pages).strip()
-    if not all_text:
-        return ""
-    parts = re.split(r"\s*\+\s*", all_text)
-    parts = [p.strip() for p in parts if p and p.strip()]
-    return "\n".join(parts)
+    flush()
+    return "\n".join(paragraphs)
+
+
+# Reusable per-process pixel buffer for rendered pages; grown on demand by _render_gray
+_page_buffer = None
 
 
-def decode_qr_from_pdf(pdf_path: Path, zoom: float = 4.0) -> str:
+def _render_gray(page, zoom: float):
+    """
+    Render a page at the given zoom into a single-channel uint8 ndarray.
+    The array is a view into a shared buffer and is overwritten by the next call.
+    """
+    global _page_buffer
+
+    mat = fitz.Matrix(zoom, zoom)
+    # QR detection only needs luminance, so render straight to grayscale
+    pix = page.get_pixmap(matrix=mat, alpha=False, colorspace=fitz.csGRAY)
+    h, w = pix.h, pix.w
+    if _page_buffer is None or _page_buffer.size < h * w:
+        _page_buffer = np.empty(h * w, dtype=np.uint8)
+    img = _page_buffer[: h * w].reshape(h, w)
+    # Copy straight from MuPDF's memory (samples_mv is zero-copy) instead of
+    # allocating a fresh bytes object per page via pix.samples
+    np.copyto(img, np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(h, w))
+    # Drop the pixmap so only the reusable buffer stays alive
+    pix = None
+    return img
+
+
+def _detect_items(img, detector) -> list[tuple[float, float, str, float]]:
+    """
+    Detect and decode all QR codes in a rendered image.
+    Returns the decoded items as (cy, cx, text, size) tuples in pixel coordinates.
+    `img` must be single-channel uint8 (as rendered by csGRAY), so OpenCV skips
+    its own BGR->GRAY pass.
+    """
+    # OpenCV wants a dense buffer; this is a no-op for whole-page renders
+    img = np.ascontiguousarray(img)
+
+    # Try multi decode (OpenCV versions differ in return signature)
+    decoded_info = []
+    points = None
+    try:
+        if not hasattr(detector, "detectAndDecodeMulti"):
+            # WeChatQRCode returns (texts, points) with one (4,2) array per code
+            infos, pts = detector.detectAndDecode(img)
+            decoded_info = list(infos)
+            points = pts
+        else:
+            result = detector.detectAndDecodeMulti(img)
+            # Handle different return formats across OpenCV versions
+            if isinstance(result, tuple):
+                if len(result) == 4:
+                    retval, infos, pts, _ = result
+                    if retval and infos is not None and pts is not None:
+                        decoded_info = list(infos)
+                        points = pts
+                elif len(result) == 3:
+                    infos, pts, _ = result
+                    if infos is not None and pts is not None:
+                        decoded_info = list(infos)
+                        points = pts
+    except Exception:
+        decoded_info = []
+        points = None
+
+    if not any(decoded_info) and hasattr(detector, "detectAndDecodeMulti"):
+        # The multi decoder sometimes misses a code the single-code decoder reads,
+        # which matters most for small tiles holding just one code
+        try:
+            text, pts, _ = detector.detectAndDecode(img)
+            if text and pts is not None:
+                decoded_info = [text]
+                points = pts
+        except Exception:
+            pass
+
+    if points is None or len(decoded_info) != len(points):
+        return []
+
+    # Stack all corners into one (N,4,2) array and reduce every code at once
+    try:
+        pts_arr = np.asarray(points, dtype=np.float32).reshape(-1, 4, 2)
+    except ValueError:
+        return []
+    cys = pts_arr[..., 1].mean(axis=1).tolist()
+    cxs = pts_arr[..., 0].mean(axis=1).tolist()
+    sizes = np.ptp(pts_arr[..., 1], axis=1).tolist()
+
+    return [  # (cy, cx, text, size)
+        (cy, cx, text, size)
+        for cy, cx, text, size in zip(cys, cxs, decoded_info, sizes)
+        if text
+    ]
+
+
+def _ink_runs(ink) -> tuple:
+    """Start and end (exclusive) indices of the runs of True in a 1-D bool array."""
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], ink, [0])).astype(np.int8)))
+    return edges[::2], edges[1::2]
+
+
+def _cut_positions(ink, size: int, min_gap: int) -> list[int]:
+    """
+    Pick cut positions along one image axis, roughly `size` pixels apart, each in
+    the middle of a run of at least `min_gap` ink-free lines so that no QR code is
+    ever cut. `ink` flags the lines containing dark pixels. Includes both ends.
+    """
+    n = len(ink)
+    starts, ends = _ink_runs(~ink)
+    gaps = [
+        (start + end) // 2
+        for start, end in zip(starts.tolist(), ends.tolist())
+        if end - start >= min_gap and 0 < (start + end) // 2 < n
+    ]
+    cuts = [0]
+    prev = None
+    for gap in gaps:
+        if gap - cuts[-1] > size:
+            # Close the tile at the last gap that kept it within `size`, if any
+            cuts.append(prev if prev is not None and prev > cuts[-1] else gap)
+        prev = gap
+    if n - cuts[-1] > size and prev is not None and prev > cuts[-1]:
+        cuts.append(prev)
+    cuts.append(n)
+    return cuts
+
+
+def _trim_span(ink, lo: int, hi: int, margin: int) -> Optional[tuple[int, int]]:
+    """Shrink [lo, hi) to its inked lines plus `margin`; None if it has no ink."""
+    inked = np.flatnonzero(ink[lo:hi])
+    if not inked.size:
+        return None
+    return max(lo, lo + int(inked[0]) - margin), min(
+        hi, lo + int(inked[-1]) + 1 + margin
+    )
+
+
+def _ink_tiles(img, tile_size: int) -> list[tuple[int, int, int, int]]:
+    """
+    Lay out tiles of about `tile_size` pixels, cut only along blank rows and columns
+    so that every code lies whole inside exactly one tile and no tile edge shows a
+    partial code. Returns the tiles as (y0, y1, x0, x1) boxes.
+    """
+    # Lines of codes are separated by their white quiet zones, so the longest run of
+    # inked rows approximates the largest code; gaps narrower than a fraction of it
+    # may lie inside a code and are never cut
+    row_ink = img.min(axis=1) < _INK_LEVEL
+    starts, ends = _ink_runs(row_ink)
+    code_size = int((ends - starts).max()) if starts.size else 0
+    min_gap = max(2, code_size // 10)
+
+    # Tiles are trimmed to their ink plus a margin that keeps the codes' quiet zone
+    margin = max(2, code_size // 4)
+
+    tiles: list[tuple[int, int, int, int]] = []
+    rows = _cut_positions(row_ink, tile_size, min_gap)
+    for y0, y1 in zip(rows[:-1], rows[1:]):
+        span = _trim_span(row_ink, y0, y1, margin)
+        if span is None:
+            continue
+        y0, y1 = span
+        col_ink = img[y0:y1].min(axis=0) < _INK_LEVEL
+        cols = _cut_positions(col_ink, tile_size, min_gap)
+        for x0, x1 in zip(cols[:-1], cols[1:]):
+            span = _trim_span(col_ink, x0, x1, margin)
+            if span is not None:
+                tiles.append((y0, y1, *span))
+
+    return tiles
+
+
+def _looks_like_code(tile) -> Optional[bool]:
+    """
+    Whether the ink in a tile looks like QR codes, judged by the dark share of its
+    bounding box. None if the ink is too small to hold a code at all.
+    """
+    ink = tile < _INK_LEVEL
+    ys = np.flatnonzero(ink.any(axis=1))
+    xs = np.flatnonzero(ink.any(axis=0))
+    if not ys.size:
+        return None
+    h, w = int(ys[-1] - ys[0]) + 1, int(xs[-1] - xs[0]) + 1
+    if min(h, w) < _MIN_CODE_PX:
+        return None
+    share = float(ink[ys[0] : ys[-1] + 1, xs[0] : xs[-1] + 1].mean())
+    return _CODE_INK_SHARE[0] <= share <= _CODE_INK_SHARE[1]
+
+
+def _detect_items_tiled(
+    img, detector, tile_size: int
+) -> list[tuple[float, float, str, float]]:
+    """
+    Detect QR codes tile by tile. The detector's cost grows with the image area and
+    the number of candidates per call, so scanning a page of codes in small tiles is
+    much faster and also helps with tiny codes; images that fit in one tile get a
+    single pass.
+    Only images whose tiles mostly look like codes are tiled. On text or scanned
+    pages most tiles are words, and one whole-image pass is far cheaper than a
+    detector call per word. Tiles too small to hold a code are never scanned.
+    Same return value as _detect_items, in coordinates of the whole image.
+    """
+    h, w = img.shape[:2]
+    if h <= tile_size and w <= tile_size:
+        return _detect_items(img, detector)
+
+    tiles: list[tuple[int, int, int, int]] = []
+    n_codes = 0
+    for y0, y1, x0, x1 in _ink_tiles(img, tile_size):
+        code_like = _looks_like_code(img[y0:y1, x0:x1])
+        if code_like is None:
+            continue
+        tiles.append((y0, y1, x0, x1))
+        n_codes += code_like
+    if n_codes * 2 < len(tiles):
+        return _detect_items(img, detector)
+
+    items: list[tuple[float, float, str, float]] = []
+    for y0, y1, x0, x1 in tiles:
+        items.extend(
+            (cy + y0, cx + x0, text, size)
+            for cy, cx, text, size in _detect_items(img[y0:y1, x0:x1], detector)
+        )
+
+    return items
+
+
+def _decode_page_items(
+    page, zoom: float, detector
+) -> list[tuple[float, float, str, float]]:
+    """
+    Render a single page to grayscale and detect all QR codes on it.
+    Blank pages, which have no ink at all, skip detection entirely.
+    Returns the decoded items as (cy, cx, text, size) tuples in page pixel
+    coordinates.
+    """
+    img = _render_gray(page, zoom)
+    if img.min() > _BLANK_PAGE_MIN:
+        # Page without any ink (e.g. a blank back side): nothing to detect
+        items = []
+    else:
+        tile_size = max(_TILE_MIN_PX, round(_TILE_SIZE_PT * zoom))
+        items = _detect_items_tiled(img, detector, tile_size)
+    img = None
+
+    # Periodically trim MuPDF's internal store, which otherwise grows with page count
+    if (page.number + 1) % _STORE_SHRINK_EVERY == 0:
+        fitz.TOOLS.store_shrink(100)
+
+    return items
+
+
+# Per-process state for the page-decoding pool; set up once by _init_worker
+_worker_doc = None
+_worker_zoom = 4.0
+
+
+def _init_worker(pdf_path: Path, zoom: float) -> None:
+    """Open the PDF once per worker process."""
+    global _worker_doc, _worker_zoom
+
+    _worker_doc = fitz.open(pdf_path)
+    _worker_zoom = zoom
+
+
+def _render_and_decode(
+    page_index: int,
+) -> tuple[int, list[tuple[float, float, str, float]]]:
+    """Pool task: decode one page of the worker's document, tagged with its index."""
+    page = _worker_doc[page_index]
+    return page_index, _decode_page_items(page, _worker_zoom, _DETECTOR)
+
+
+def _line_breaks(cys_sorted, y_threshold: float):
+    """Indices into the Y-sorted centers at which a new text line starts."""
+    return np.flatnonzero(np.diff(cys_sorted) > y_threshold) + 1
+
+
+def _cluster_lines(
+    items: list[tuple[float, float, str, float]],
+) -> list[list[tuple[float, float, str, float]]]:
+    """Group a page's decoded items into text lines by Y, each line ordered by X."""
+    if not items:
+        return []
+
+    # Cluster into lines by Y: a gap larger than a fraction of the median QR height starts a new line
+    sizes = np.fromiter(
+        (s for (_, _, _, s) in items), dtype=np.float32, count=len(items)
+    )
+    median_h = float(np.median(sizes))
+    y_threshold = max(5.0, 0.6 * median_h)
+
+    cys = np.fromiter((it[0] for it in items), dtype=np.float64, count=len(items))
+    cxs = np.fromiter((it[1] for it in items), dtype=np.float64, count=len(items))
+    order = np.argsort(cys, kind="stable")
+    breaks = _line_breaks(cys[order], y_threshold)
+
+    # characters in a line are read left to right
+    return [
+        [items[i] for i in group[np.argsort(cxs[group], kind="stable")]]
+        for group in np.split(order, breaks)
+    ]
+
+
+def decode_qr_from_pdf(
+    pdf_path: Path, zoom: float = 4.0, workers: Optional[int] = None
+) -> str:
     """
     Render each PDF page to an image and detect multiple QR codes.
     Each QR encodes a single character. We reconstruct lines by clustering by Y.
+    Pages are decoded in parallel by `workers` processes (default: CPU count);
+    workers=1 keeps everything in the current process.
     """
-    import statistics
+    global _page_buffer
 
-    try:
-        import fitz  # PyMuPDF
-        import numpy as np
-        import cv2
-    except Exception as e:
+    if fitz is None or np is None or cv2 is None:
         raise RuntimeError(
             "需要安装依赖：PyMuPDF、opencv-python、numpy。请先安装后重试。"
-        ) from e
-
-    detector = cv2.QRCodeDetector()
-    lines_all_pages: list[list[tuple[float, float, str, float]]] = (
-        []
-    )  # per page lines after clustering
+        )
 
     with fitz.open(pdf_path) as doc:
-        for page in doc:
-            # Render page
-            mat = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=mat, alpha=False)
-            n_channels = pix.n  # 3 for RGB
-            img = np.frombuffer(pix.samples, dtype=np.uint8).reshape(
-                pix.h, pix.w, n_channels
-            )
-            # Convert to BGR for OpenCV if needed (PyMuPDF returns RGB). OpenCV expects BGR, but for QR it's fine either way.
-            img_bgr = img[:, :, ::-1].copy() if n_channels == 3 else img
-
-            # Try multi decode (OpenCV versions differ in return signature)
-            decoded_info = []
-            points = None
+        page_count = doc.page_count
+        n_workers = min(workers or os.cpu_count() or 1, page_count)
+        if n_workers <= 1:
             try:
-                result = detector.detectAndDecodeMulti(img_bgr)
-                # Handle different return formats across OpenCV versions
-                if isinstance(result, tuple):
-                    if len(result) == 4:
-                        retval, infos, pts, _ = result
-                        if retval and infos is not None and pts is not None:
-                            decoded_info = list(infos)
-                            points = pts
-                    elif len(result) == 3:
-                        infos, pts, _ = result
-                        if infos is not None and pts is not None:
-                            decoded_info = list(infos)
-                            points = pts
-            except Exception:
-                decoded_info = []
-                points = None
-
-            items: list[tuple[float, float, str, float]] = []  # (cy, cx, text, size)
-            if points is not None and len(decoded_info) == len(points):
-                for info, pts in zip(decoded_info, points):
-                    text = info or ""
-                    # pts shape (4,2)
-                    try:
-                        cy = float(pts[:, 1].mean())
-                        cx = float(pts[:, 0].mean())
-                        size = float(pts[:, 1].max() - pts[:, 1].min())
-                    except Exception:
-                        continue
-                    if text:
-                        items.append((cy, cx, text, size))
-
-            # If multi failed or produced too few items, try a simple grid-based enhancement isn't implemented here
-            # We proceed with whatever we decoded.
-
-            if not items:
-                lines_all_pages.append([])
-                continue
-
-            # Cluster into lines by Y using a running-average threshold based on median QR height
-            median_h = (
-                statistics.median([s for (_, _, _, s) in items]) if items else 20.0
-            )
-            y_threshold = max(5.0, 0.6 * median_h)
-
-            items.sort(key=lambda t: (t[0], t[1]))  # sort by y then x
-            lines: list[list[tuple[float, float, str, float]]] = []
-            current_line: list[tuple[float, float, str, float]] = []
-            current_y = None
-            for it in items:
-                y = it[0]
-                if current_y is None:
-                    current_line = [it]
-                    current_y = y
-                elif abs(y - current_y) <= y_threshold:
-                    current_line.append(it)
-                    # Update running average y
-                    current_y = (current_y * 0.7) + (y * 0.3)
-                else:
-                    # finalize current line
-                    current_line.sort(key=lambda t: t[1])
-                    lines.append(current_line)
-                    current_line = [it]
-                    current_y = y
+                items_per_page = [
+                    _decode_page_items(page, zoom, _DETECTOR) for page in doc
+                ]
+            finally:
+                # The buffer is as large as the biggest rendered page (about 32 MB for
+                # A4 at zoom 8); don't keep it alive for library callers between calls
+                _page_buffer = None
 
-            if current_line:
-                current_line.sort(key=lambda t: t[1])
-                lines.append(current_line)
+    if n_workers > 1:
+        # Each page is independent and CPU-bound; decode them across processes
+        items_per_page = [[] for _ in range(page_count)]
+        with multiprocessing.Pool(
+            processes=n_workers, initializer=_init_worker, initargs=(pdf_path, zoom)
+        ) as pool:
+            for page_index, items in pool.imap_unordered(
+                _render_and_decode, range(page_count)
+            ):
+                items_per_page[page_index] = items
 
-            lines_all_pages.append(lines)
+    # per page lines after clustering
+    lines_all_pages: list[list[list[tuple[float, float, str, float]]]] = [
+        _cluster_lines(items) for items in items_per_page
+    ]
 
     # Compose by scanning characters and using '+' as paragraph delimiter; do not output '+'
     paragraphs: list[str] = []
-    current: list[str] = []
+    buf = io.StringIO()
 
     for page_lines in lines_all_pages:
         if not page_lines:
             continue
-        for li, line in enumerate(page_lines):
+        for line in page_lines:
             # characters in reading order for this line
-            line_chars = [ch[2] for ch in line]
-            for ch in line_chars:
+            for ch in (it[2] for it in line):
                 if ch == "+":
-                    # end of paragraph; flush current
-                    paragraph = "".join(current).strip()
+                    # end of paragraph; flush the buffer and reuse it
+                    paragraph = buf.getvalue().strip()
                     if paragraph:
                         paragraphs.append(paragraph)
-                    current = []
+                    buf.seek(0)
+                    buf.truncate()
                 else:
-                    current.append(ch)
+                    buf.write(ch)
 
     # flush any remaining content as the last paragraph
-    tail = "".join(current).strip()
+    tail = buf.getvalue().strip()
     if tail:
         paragraphs.append(tail)
 
@@ -190,6 +531,12 @@ def main():
         default=4.0,
         help="渲染倍率（用于二维码扫描回退路径），默认 4.0",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="二维码扫描使用的并行进程数，默认等于 CPU 核数；设为 1 则单进程运行",
+    )
     args = parser.parse_args()
 
     in_path = Path(args.input).expanduser().resolve()
@@ -205,7 +552,7 @@ def main():
     # 2) Fallback to QR detection if needed
     if not text:
         try:
-            text = decode_qr_from_pdf(in_path, zoom=args.zoom)
+            text = decode_qr_from_pdf(in_path, zoom=args.zoom, workers=args.workers)
         except Exception as e:
             print(f"二维码扫描失败：{e}", file=sys.stderr)
             sys.exit(2)